@@ -1,33 +1,95 @@
+from gevent import monkey
+monkey.patch_all()
+
 from flask import (
     Flask, render_template, redirect,
-    url_for, flash, abort, request
+    url_for, flash, abort, request, jsonify
 )
 from flask_login import (
     LoginManager, login_user, logout_user,
     login_required, current_user
 )
+from flask_session import Session
 from config import get_config
-from database import check_database_connection, init_database
+from database import (
+    check_database_connection, close_db_connection,
+    init_database, redis_client
+)
 from models import User, Facility, Booking
 from forms import LoginForm, RegisterForm, FacilityForm, BookingForm
-from time import time
+from werkzeug.middleware.profiler import ProfilerMiddleware
+from werkzeug.utils import secure_filename
+import click
 from datetime import date
 from flask import session
+import hashlib
 import logging
+import math
 import os
+import tempfile
 
 # APP SETUP
 
 app = Flask(__name__)
 app.config.from_object(get_config())
+app.config["SESSION_REDIS"] = redis_client
+Session(app)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+if app.config["PROFILE"]:
+    # Print the 20 most expensive calls of each request to stdout
+    app.wsgi_app = ProfilerMiddleware(app.wsgi_app, restrictions=[20])
+
+# One pooled connection per request, returned on teardown
+app.teardown_appcontext(close_db_connection)
+
 UPLOAD_FOLDER = "static/uploads/facilities"
 app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
+
+def _save_facility_image(image):
+    """
+    Stream an uploaded image to disk under a content-hash filename
+    Re-uploading the same file yields the same name (and URL)
+    """
+    ext = os.path.splitext(secure_filename(image.filename))[1].lower()
+    digest = hashlib.sha256()
+
+    with tempfile.NamedTemporaryFile(
+        dir=app.config["UPLOAD_FOLDER"], delete=False
+    ) as dest:
+        try:
+            while chunk := image.stream.read(65536):
+                digest.update(chunk)
+                dest.write(chunk)
+        except BaseException:
+            dest.close()
+            os.unlink(dest.name)
+            raise
+
+    # Temp files are created 0600; nginx serves uploads as another user
+    os.chmod(dest.name, 0o644)
+    image_name = f"{digest.hexdigest()[:16]}{ext}"
+    os.replace(dest.name, os.path.join(app.config["UPLOAD_FOLDER"], image_name))
+    return image_name
+
+
+def _paginate(total):
+    """
+    Resolve the ?page= query argument against a row count
+
+    Returns:
+        tuple: (page, total_pages, offset)
+    """
+    per_page = app.config["ITEMS_PER_PAGE"]
+    total_pages = max(math.ceil(total / per_page), 1)
+    page = min(max(request.args.get("page", 1, type=int), 1), total_pages)
+    return page, total_pages, (page - 1) * per_page
+
+
 # LOGIN MANAGER
 
 login_manager = LoginManager(app)
@@ -153,32 +215,19 @@ def my_bookings():
     if not current_user.is_staff():
         abort(403)
 
-    raw_bookings = Booking.get_by_user(current_user.user_id)
     stats = Booking.get_user_stats(current_user.user_id)
-
-    bookings = []
-    for b in raw_bookings:
-        def format_time(t):
-            if hasattr(t, "strftime"):
-                return t.strftime("%H:%M")
-            if hasattr(t, "total_seconds"):
-                h = int(t.total_seconds() // 3600)
-                m = int((t.total_seconds() % 3600) // 60)
-                return f"{h:02d}:{m:02d}"
-            return str(t)
-
-        bookings.append({
-            "booking_id": b.booking_id,
-            "facility_name": b.facility_name,
-            "booking_date": b.booking_date.strftime("%d %b %Y"),
-            "time": f"{format_time(b.start_time)} – {format_time(b.end_time)}",
-            "status": b.status,
-        })
+    page, total_pages, offset = _paginate(stats["total"])
 
     return render_template(
         "booking_history.html",
-        bookings=bookings,
+        bookings=Booking.get_by_user_raw(
+            current_user.user_id,
+            limit=app.config["ITEMS_PER_PAGE"],
+            offset=offset
+        ),
         stats=stats,
+        page=page,
+        total_pages=total_pages,
         is_admin=False,
         active_page="bookings",
     )
@@ -230,17 +279,9 @@ def admin_dashboard():
     if not current_user.is_admin():
         abort(403)
 
-    stats = {
-        "total": Booking.get_total_count(),
-        "pending": Booking.get_pending_count(),
-        "approved": Booking.get_approved_count(),
-        "rejected": Booking.get_rejected_count(),
-        "facilities": Facility.get_active_count(),
-    }
-
     return render_template(
         "dashboard_admin.html",
-        stats=stats,
+        stats=Booking.get_dashboard_counts(),
         recent_bookings=Booking.get_recent(limit=10),
         active_page="dashboard",
     )
@@ -253,9 +294,17 @@ def pending_bookings():
     if not current_user.is_admin():
         abort(403)
 
+    page, total_pages, offset = _paginate(Booking.get_pending_count())
+
     return render_template(
         "pending_bookings.html",
-        bookings=Booking.get_all(status="pending"),
+        bookings=Booking.get_all_raw(
+            status="pending",
+            limit=app.config["ITEMS_PER_PAGE"],
+            offset=offset
+        ),
+        page=page,
+        total_pages=total_pages,
         active_page="bookings"
     )
 
@@ -311,8 +360,7 @@ def create_facility():
     image_name = None
     image = request.files.get("image")
     if image and image.filename:
-        image_name = f"{int(time())}_{image.filename}"
-        image.save(os.path.join(app.config["UPLOAD_FOLDER"], image_name))
+        image_name = _save_facility_image(image)
 
     Facility.create(
         form.name.data,
@@ -350,8 +398,7 @@ def update_facility():
     image_name = facility.image
     image = request.files.get("image")
     if image and image.filename:
-        image_name = f"{int(time())}_{image.filename}"
-        image.save(os.path.join(app.config["UPLOAD_FOLDER"], image_name))
+        image_name = _save_facility_image(image)
 
     Facility.update(
         facility.facility_id,
@@ -394,13 +441,37 @@ def delete_facility(facility_id):
 @login_required
 def api_stats():
     if current_user.is_admin():
-        return {
-            "total": Booking.get_total_count(),
-            "pending": Booking.get_pending_count(),
-            "approved": Booking.get_approved_count(),
+        counts = Booking.get_dashboard_counts()
+        stats = {
+            "total": counts["total"],
+            "pending": counts["pending"],
+            "approved": counts["approved"],
         }
+    else:
+        stats = Booking.get_user_stats(current_user.user_id)
+
+    # Polled by the dashboards: let unchanged stats come back as 304.
+    # Counts come from the Redis stats cache, so polling never hits MySQL;
+    # the ETag is weak as it vouches for the counts, not the exact bytes
+    response = jsonify(stats)
+    response.headers["Cache-Control"] = "private, max-age=10"
+    response.add_etag(weak=True)
+    return response.make_conditional(request)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+@app.cli.command("db-init")
+def db_init():
+    """Create missing tables and indexes (run once per deploy)."""
+    if not check_database_connection():
+        raise click.ClickException("Database connection failed")
 
-    return Booking.get_user_stats(current_user.user_id)
+    if not init_database():
+        raise click.ClickException("Database initialization failed")
+    click.echo("Database initialized.")
 
 
 # =============================================================================
@@ -412,5 +483,4 @@ if __name__ == "__main__":
         logger.error("Database connection failed")
         exit(1)
 
-    init_database()
-    app.run(debug=True)
+    app.run(debug=app.config["DEBUG"])
@@ -15,7 +15,8 @@ class Config:
     
     # Flask settings
     SECRET_KEY = os.getenv('SECRET_KEY', 'your-secret-key-change-this-in-production')
-    DEBUG = os.getenv('DEBUG', 'True') == 'True'
+    DEBUG = os.getenv('DEBUG', 'False') == 'True'
+    PROFILE = os.getenv('PROFILE', 'False') == 'True'  # Per-request cProfile output
     
     # MySQL Database settings
     DB_HOST = os.getenv('DB_HOST', 'localhost')
@@ -23,8 +24,20 @@ class Config:
     DB_PASSWORD = os.getenv('DB_PASSWORD', '')
     DB_NAME = os.getenv('DB_NAME', 'booking_system')
     DB_PORT = int(os.getenv('DB_PORT', 3306))
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 10))  # Per process; see gunicorn.conf.py
+    DB_POOL_MIN_CACHED = int(os.getenv('DB_POOL_MIN_CACHED', 4))  # Opened at startup
+    # 'pymysql' (pure Python, required with gevent workers) or 'mysqlclient' (C)
+    DB_DRIVER = os.getenv('DB_DRIVER', 'pymysql')
     
-    # Session settings
+    # Redis cache settings
+    REDIS_HOST = os.getenv('REDIS_HOST', 'localhost')
+    REDIS_PORT = int(os.getenv('REDIS_PORT', 6379))
+    REDIS_DB = int(os.getenv('REDIS_DB', 0))
+    
+    # Session settings (server-side sessions stored in Redis)
+    SESSION_TYPE = 'redis'
+    SESSION_USE_SIGNER = True
+    SESSION_KEY_PREFIX = 'session:'
     SESSION_COOKIE_SECURE = False  # Set to True in production with HTTPS
     SESSION_COOKIE_HTTPONLY = True
     SESSION_COOKIE_SAMESITE = 'Lax'
@@ -38,8 +51,7 @@ class Config:
 
 
 class DevelopmentConfig(Config):
-    """Development environment configuration"""
-    DEBUG = True
+    """Development environment configuration (DEBUG comes from the env)"""
     TESTING = False
 
 
@@ -51,8 +63,7 @@ class ProductionConfig(Config):
 
 
 class TestingConfig(Config):
-    """Testing environment configuration"""
-    DEBUG = True
+    """Testing environment configuration (DEBUG comes from the env)"""
     TESTING = True
     DB_NAME = 'booking_system_test'
 
@@ -3,10 +3,14 @@ Database connection and management module
 Handles MySQL connections and provides connection pooling
 """
 
-import mysql.connector
-from mysql.connector import pooling
+from dbutils.pooled_db import PooledDB
+import redis
+from flask import g, has_app_context
 from config import get_config
+from contextlib import contextmanager
+from itertools import islice
 import logging
+import pickle
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -15,22 +19,66 @@ logger = logging.getLogger(__name__)
 # Get configuration
 config = get_config()
 
+# Load the configured MySQL driver; both expose the same DB-API surface
+if config.DB_DRIVER == 'mysqlclient':
+    import MySQLdb as db_driver
+    from MySQLdb.cursors import Cursor, DictCursor, SSCursor, SSDictCursor
+else:
+    import pymysql as db_driver
+    from pymysql.cursors import Cursor, DictCursor, SSCursor, SSDictCursor
+
+connect_args = {
+    'host': config.DB_HOST,
+    'port': config.DB_PORT,
+    'database': config.DB_NAME,
+    'user': config.DB_USER,
+    'password': config.DB_PASSWORD,
+    'charset': 'utf8mb4',
+    # Queries keep no session state and autocommit leaves no transaction
+    # open, so connections need no reset when returned to the pool
+    'autocommit': True,
+}
+
+
+def create_connection_pool(mincached):
+    """
+    Create the shared connection pool
+    
+    Args:
+        mincached (int): Connections opened up front and kept idle
+    
+    Returns:
+        PooledDB: Pool handing out connections, blocking when exhausted
+    """
+    return PooledDB(
+        creator=db_driver,
+        # PooledDB blocks forever warming more connections than it may open
+        mincached=min(mincached, config.DB_POOL_SIZE),
+        maxconnections=config.DB_POOL_SIZE,
+        blocking=True,
+        ping=1,  # Check liveness on checkout, reconnecting stale connections
+        reset=False,
+        **connect_args
+    )
+
+
 # Create connection pool
 try:
-    connection_pool = pooling.MySQLConnectionPool(
-        pool_name="booking_pool",
-        pool_size=5,
-        pool_reset_session=True,
-        host=config.DB_HOST,
-        port=config.DB_PORT,
-        database=config.DB_NAME,
-        user=config.DB_USER,
-        password=config.DB_PASSWORD
-    )
+    connection_pool = create_connection_pool(config.DB_POOL_MIN_CACHED)
     logger.info("Database connection pool created successfully")
-except mysql.connector.Error as err:
-    logger.error(f"Error creating connection pool: {err}")
-    connection_pool = None
+except db_driver.Error as err:
+    # Database not reachable yet: start with an empty pool that connects on demand
+    logger.error(f"Error warming connection pool: {err}")
+    connection_pool = create_connection_pool(0)
+
+# Create Redis client (connections are opened lazily on first command)
+redis_client = redis.Redis(
+    host=config.REDIS_HOST,
+    port=config.REDIS_PORT,
+    db=config.REDIS_DB,
+    socket_connect_timeout=1,
+    socket_timeout=1
+)
 
 
 def get_db_connection():
@@ -43,23 +91,62 @@ def get_db_connection():
     """
     try:
         if connection_pool:
-            connection = connection_pool.get_connection()
+            connection = connection_pool.connection()
             return connection
         else:
             # Fallback to direct connection if pool not available
-            connection = mysql.connector.connect(
-                host=config.DB_HOST,
-                port=config.DB_PORT,
-                database=config.DB_NAME,
-                user=config.DB_USER,
-                password=config.DB_PASSWORD
-            )
+            connection = db_driver.connect(**connect_args)
             return connection
-    except mysql.connector.Error as err:
+    except db_driver.Error as err:
         logger.error(f"Database connection error: {err}")
         return None
 
 
+@contextmanager
+def db_cursor(dictionary=True):
+    """
+    Yield a cursor on a pooled connection
+    
+    Inside a Flask app context the connection is checked out once and shared
+    by every query of the request, then returned by close_db_connection() on
+    teardown. Outside an app context it is returned when the block exits.
+    
+    Args:
+        dictionary (bool): Return rows as dicts instead of tuples
+    
+    Raises:
+        db_driver.Error: If no connection can be obtained
+    """
+    shared = has_app_context()
+    connection = g.get('db_connection') if shared else None
+    
+    if connection is None:
+        connection = get_db_connection()
+        if connection is None:
+            raise db_driver.InterfaceError("No database connection available")
+        if shared:
+            g.db_connection = connection
+    
+    # Both cursor classes buffer the full result, so a partially read
+    # result never blocks the next query on a shared connection
+    cursor = connection.cursor(DictCursor if dictionary else Cursor)
+    try:
+        yield cursor
+    finally:
+        cursor.close()
+        if not shared:
+            connection.close()
+
+
+def close_db_connection(exception=None):
+    """
+    Return the request's connection to the pool (app teardown handler)
+    """
+    connection = g.pop('db_connection', None)
+    if connection is not None:
+        connection.close()
+
+
 def execute_query(query, params=None, fetch=False, fetch_one=False):
     """
     Execute a database query with proper error handling
@@ -73,40 +160,169 @@ def execute_query(query, params=None, fetch=False, fetch_one=False):
     Returns:
         Result of query execution or None on error
     """
-    connection = None
-    cursor = None
-    
     try:
-        connection = get_db_connection()
-        if not connection:
-            return None
-        
-        cursor = connection.cursor(dictionary=True)
-        cursor.execute(query, params or ())
-        
-        if fetch_one:
-            result = cursor.fetchone()
-        elif fetch:
-            result = cursor.fetchall()
-        else:
-            connection.commit()
-            result = cursor.lastrowid if cursor.lastrowid else True
+        with db_cursor() as cursor:
+            cursor.execute(query, params or ())
+            
+            if fetch_one:
+                result = cursor.fetchone()
+            elif fetch:
+                result = cursor.fetchall()
+            else:
+                result = cursor.lastrowid if cursor.lastrowid else True
         
         return result
         
-    except mysql.connector.Error as err:
+    except db_driver.Error as err:
         logger.error(f"Query execution error: {err}")
         logger.error(f"Query: {query}")
         logger.error(f"Params: {params}")
-        if connection:
-            connection.rollback()
         return None
-        
+
+
+def stream_query(query, params=None, chunk_size=1000, dictionary=False):
+    """
+    Yield rows from a server-side (unbuffered) cursor, fetched chunk by chunk
+    Memory stays constant regardless of result size. Uses a dedicated
+    connection, since an unread streamed result blocks every other query on
+    its connection
+    
+    Inside an app context the request's shared connection is returned to the
+    pool first, so each caller holds at most one connection and a full
+    blocking pool cannot deadlock. Do not run other queries in the same
+    request while iterating; they would check out a second connection
+    
+    Args:
+        query (str): SQL query to execute
+        params (tuple): Parameters for parameterized query
+        chunk_size (int): Rows fetched from the server per round-trip
+        dictionary (bool): Yield rows as dicts instead of tuples
+    
+    Raises:
+        db_driver.Error: If no connection can be obtained or the query fails
+    """
+    if has_app_context():
+        close_db_connection()
+    
+    connection = get_db_connection()
+    if connection is None:
+        raise db_driver.InterfaceError("No database connection available")
+    
+    cursor = connection.cursor(SSDictCursor if dictionary else SSCursor)
+    try:
+        cursor.execute(query, params or ())
+        while rows := cursor.fetchmany(chunk_size):
+            yield from rows
     finally:
-        if cursor:
-            cursor.close()
-        if connection and connection.is_connected():
-            connection.close()
+        cursor.close()
+        connection.close()
+
+
+def execute_bulk(query, seq_params, commit_size=500):
+    """
+    Execute one INSERT for many parameter tuples in multi-row batches
+    The driver's executemany() rewrites INSERT ... VALUES (%s, ...) into a
+    single multi-row statement per batch
+    
+    Args:
+        query (str): INSERT query with a single VALUES (%s, ...) group
+        seq_params (iterable): Parameter tuples, one per row
+        commit_size (int): Rows per statement (each commits on its own)
+    
+    Returns:
+        int: Number of inserted rows, or None on error
+    """
+    total = 0
+    
+    try:
+        with db_cursor(dictionary=False) as cursor:
+            rows = iter(seq_params)
+            while batch := list(islice(rows, commit_size)):
+                cursor.executemany(query, batch)
+                total += cursor.rowcount
+        
+        return total
+        
+    except db_driver.Error as err:
+        logger.error(f"Bulk execution error after {total} rows: {err}")
+        logger.error(f"Query: {query}")
+        return None
+
+
+def cache_get_or_set(key, ttl, loader):
+    """
+    Read-through cache backed by Redis
+    
+    Args:
+        key (str): Redis key to read/write
+        ttl (int): Time to live in seconds for a freshly loaded value
+        loader (callable): Function returning the value on a cache miss
+    
+    Returns:
+        Cached value, or the loader result when missing or Redis is unavailable
+    """
+    try:
+        cached = redis_client.get(key)
+        if cached is not None:
+            return pickle.loads(cached)
+    except redis.RedisError as err:
+        logger.warning(f"Cache read error for '{key}': {err}")
+        return loader()
+    
+    value = loader()
+    if value is not None:
+        try:
+            redis_client.setex(key, ttl, pickle.dumps(value))
+        except redis.RedisError as err:
+            logger.warning(f"Cache write error for '{key}': {err}")
+    
+    return value
+
+
+def cache_delete(*keys):
+    """
+    Invalidate one or more cached keys
+    
+    Args:
+        keys (str): Redis keys to delete
+    """
+    try:
+        redis_client.delete(*keys)
+    except redis.RedisError as err:
+        logger.warning(f"Cache delete error for {keys}: {err}")
+
+
+# Columns added after the initial schema, keyed by (table, column name)
+COLUMN_MIGRATIONS = {
+    # Filename under static/uploads/facilities; the image bytes live on disk
+    ('facilities', 'image'):
+        "ALTER TABLE facilities ADD COLUMN image VARCHAR(255) NULL",
+}
+
+
+# Indexes added after the initial schema, keyed by (table, index name)
+INDEX_MIGRATIONS = {
+    ('bookings', 'idx_user_date_status'):
+        "CREATE INDEX idx_user_date_status "
+        "ON bookings (user_id, booking_date, status)",
+    ('bookings', 'idx_user_status'):
+        "CREATE INDEX idx_user_status ON bookings (user_id, status)",
+    ('bookings', 'idx_created'):
+        "CREATE INDEX idx_created ON bookings (created_at)",
+    ('bookings', 'idx_status_created'):
+        "CREATE INDEX idx_status_created ON bookings (status, created_at)",
+    ('bookings', 'idx_facility_status'):
+        "CREATE INDEX idx_facility_status ON bookings (facility_id, status)",
+}
+
+# Indexes that are a prefix of a wider one above, keyed by (table, index
+# name) -> (superseding index, drop query); dropped once that one exists
+INDEX_DROPS = {
+    ('bookings', 'idx_user_date'):
+        ('idx_user_date_status', "DROP INDEX idx_user_date ON bookings"),
+    ('bookings', 'idx_status'):
+        ('idx_status_created', "DROP INDEX idx_status ON bookings"),
+}
 
 
 def init_database():
@@ -133,6 +349,7 @@ def init_database():
                 capacity INT NOT NULL,
                 status ENUM('active', 'inactive') DEFAULT 'active',
                 description TEXT,
+                image VARCHAR(255),
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """,
@@ -150,7 +367,11 @@ def init_database():
                 FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE,
                 FOREIGN KEY (facility_id) REFERENCES facilities(facility_id) ON DELETE CASCADE,
                 INDEX idx_date_facility (booking_date, facility_id),
-                INDEX idx_status (status)
+                INDEX idx_user_date_status (user_id, booking_date, status),
+                INDEX idx_user_status (user_id, status),
+                INDEX idx_created (created_at),
+                INDEX idx_status_created (status, created_at),
+                INDEX idx_facility_status (facility_id, status)
             )
         """
     }
@@ -163,6 +384,8 @@ def init_database():
             else:
                 logger.error(f"Failed to create table '{table_name}'")
         
+        migrate_columns()
+        migrate_indexes()
         return True
         
     except Exception as e:
@@ -170,6 +393,77 @@ def init_database():
         return False
 
 
+def migrate_columns():
+    """
+    Add columns introduced after the initial schema to existing installs
+    Fresh installs already get them from CREATE TABLE and are skipped
+    """
+    
+    for (table_name, column_name), alter_query in COLUMN_MIGRATIONS.items():
+        row = execute_query(
+            """
+            SELECT COUNT(*) AS count
+            FROM information_schema.columns
+            WHERE table_schema = DATABASE()
+              AND table_name = %s
+              AND column_name = %s
+            """,
+            (table_name, column_name),
+            fetch_one=True
+        )
+        if row is None or row['count'] > 0:
+            continue
+        
+        if execute_query(alter_query) is not None:
+            logger.info(f"Column '{column_name}' added to '{table_name}'")
+        else:
+            logger.error(f"Failed to add column '{column_name}' to '{table_name}'")
+
+
+def _index_count(table_name, index_name):
+    """Number of index entries for the given name, or None on query error"""
+    row = execute_query(
+        """
+        SELECT COUNT(*) AS count
+        FROM information_schema.statistics
+        WHERE table_schema = DATABASE()
+          AND table_name = %s
+          AND index_name = %s
+        """,
+        (table_name, index_name),
+        fetch_one=True
+    )
+    return None if row is None else row['count']
+
+
+def migrate_indexes():
+    """
+    Add indexes introduced after the initial schema to existing installs,
+    then drop the ones they supersede
+    Fresh installs already match CREATE TABLE and are skipped
+    """
+    
+    for (table_name, index_name), create_query in INDEX_MIGRATIONS.items():
+        if _index_count(table_name, index_name) != 0:
+            continue
+        
+        if execute_query(create_query) is not None:
+            logger.info(f"Index '{index_name}' created on '{table_name}'")
+        else:
+            logger.error(f"Failed to create index '{index_name}' on '{table_name}'")
+    
+    for (table_name, index_name), (superseded_by, drop_query) in INDEX_DROPS.items():
+        if not _index_count(table_name, index_name):
+            continue
+        if not _index_count(table_name, superseded_by):
+            continue
+        
+        if execute_query(drop_query) is not None:
+            logger.info(f"Index '{index_name}' dropped from '{table_name}'")
+        else:
+            logger.error(f"Failed to drop index '{index_name}' from '{table_name}'")
+
+
 def check_database_connection():
     """
     Check if database connection is working
@@ -178,7 +472,7 @@ def check_database_connection():
         bool: True if connection is successful, False otherwise
     """
     connection = get_db_connection()
-    if connection and connection.is_connected():
+    if connection:
         connection.close()
         return True
     return False
@@ -205,7 +499,7 @@ def test_database():
         
         connection = get_db_connection()
         
-        if not connection or not connection.is_connected():
+        if not connection:
             print("❌ Connection failed!")
             print("\n🔧 Troubleshooting:")
             print("   1. Check if MySQL service is running")
@@ -216,7 +510,7 @@ def test_database():
         
         print("✅ Connection successful!")
         
-        cursor = connection.cursor(dictionary=True)
+        cursor = connection.cursor(DictCursor)
         
         # Get MySQL version
         cursor.execute("SELECT VERSION()")
@@ -241,7 +535,7 @@ def test_database():
                 print("✅ Database tables created successfully")
                 # Reconnect to show tables
                 connection = get_db_connection()
-                cursor = connection.cursor(dictionary=True)
+                cursor = connection.cursor(DictCursor)
                 cursor.execute("SHOW TABLES")
                 tables = cursor.fetchall()
         
@@ -289,7 +583,7 @@ def test_database():
         print("=" * 70)
         return True
         
-    except mysql.connector.Error as err:
+    except db_driver.Error as err:
         print(f"\n❌ DATABASE ERROR!")
         print(f"Error: {err}")
         print("\n🔧 Common solutions:")
@@ -4,12 +4,17 @@ from wtforms.validators import DataRequired, Email, Length, NumberRange, Validat
 from datetime import datetime, date
 from wtforms import HiddenField
 
+# Stateless validators shared by the auth forms
+_DATA_REQUIRED = DataRequired()
+_EMAIL = Email()
+_PASSWORD_LENGTH = Length(min=6)
+
 
 class LoginForm(FlaskForm):
     """Login form"""
     email = StringField(
         'Email',
-        validators=[DataRequired(), Email()],
+        validators=[_DATA_REQUIRED, _EMAIL],
         render_kw={
             "id": "login-email",
             "placeholder": "you@example.com"
@@ -18,7 +23,7 @@ class LoginForm(FlaskForm):
 
     password = PasswordField(
         'Password',
-        validators=[DataRequired()],
+        validators=[_DATA_REQUIRED],
         render_kw={
             "id": "login-password",
             "placeholder": "Enter your password"
@@ -32,7 +37,7 @@ class LoginForm(FlaskForm):
 class RegisterForm(FlaskForm):
     name = StringField(
         "Full Name",
-        validators=[DataRequired(), Length(min=2, max=100)],
+        validators=[_DATA_REQUIRED, Length(min=2, max=100)],
         render_kw={
             "id": "register-name",
             "placeholder": "John Doe"
@@ -41,7 +46,7 @@ class RegisterForm(FlaskForm):
 
     email = StringField(
         "Email",
-        validators=[DataRequired(), Email()],
+        validators=[_DATA_REQUIRED, _EMAIL],
         render_kw={
             "id": "register-email",
             "placeholder": "you@example.com"
@@ -50,7 +55,7 @@ class RegisterForm(FlaskForm):
 
     password = PasswordField(
         "Password",
-        validators=[DataRequired(), Length(min=6)],
+        validators=[_DATA_REQUIRED, _PASSWORD_LENGTH],
         render_kw={
             "id": "register-password",
             "placeholder": "At least 6 characters"
@@ -59,7 +64,7 @@ class RegisterForm(FlaskForm):
 
     confirm_password = PasswordField(
         "Confirm Password",
-        validators=[DataRequired(), EqualTo("password", message="Passwords must match")],
+        validators=[_DATA_REQUIRED, EqualTo("password", message="Passwords must match")],
         render_kw={
             "id": "register-confirm-password",
             "placeholder": "Confirm your password"
@@ -72,7 +77,7 @@ class RegisterForm(FlaskForm):
             ('staff', 'Staff'),
             ('admin', 'Admin')
         ],
-        validators=[DataRequired()]
+        validators=[_DATA_REQUIRED]
     )
 
     submit = SubmitField('Register')
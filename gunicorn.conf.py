@@ -0,0 +1,29 @@
+"""
+Gunicorn configuration for production deployments
+Uses gevent workers so requests waiting on MySQL/Redis yield instead of blocking a process
+
+Run with: gunicorn app:app
+"""
+
+import multiprocessing
+import os
+from dotenv import load_dotenv
+
+# Read .env before deriving defaults, so values set there count as explicit
+load_dotenv()
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+worker_class = 'gevent'
+# One process per core: gevent already multiplexes requests within a worker
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', 1000))
+
+# Every worker holds its own pool of up to DB_POOL_SIZE MySQL connections,
+# so the server sees workers * DB_POOL_SIZE in total. Unless DB_POOL_SIZE is
+# set explicitly, split DB_CONNECTION_BUDGET (default 140, under MySQL's
+# default max_connections of 151) across the workers, at most 10 each:
+# 8 cores -> 8 x 10 = 80 connections, 32 cores -> 32 x 4 = 128
+db_connection_budget = int(os.getenv('DB_CONNECTION_BUDGET', 140))
+os.environ.setdefault(
+    'DB_POOL_SIZE', str(max(min(db_connection_budget // workers, 10), 1))
+)
@@ -4,35 +4,149 @@ Compatible with MySQL schema using `password` column
 """
 
 from datetime import datetime
+from types import SimpleNamespace
 from flask_login import UserMixin
-from werkzeug.security import generate_password_hash, check_password_hash
-from database import get_db_connection
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
+from database import (
+    db_cursor, execute_bulk, stream_query, cache_get_or_set, cache_delete
+)
+from utils import request_cached, clear_request_cache
 import logging
 
 logger = logging.getLogger(__name__)
 
+password_hasher = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=1)
+
+USER_CACHE_TTL = 600
+FACILITY_CACHE_TTL = 300
+FACILITY_CACHE_KEYS = ("facilities:all:active", "facilities:all:any")
+ADMIN_STATS_CACHE_TTL = 15
+ADMIN_STATS_CACHE_KEY = "admin:stats"
+USER_STATS_CACHE_TTL = 30
+
+# Explicit projections instead of SELECT *. Facility lists skip the
+# description TEXT column, which only single-facility reads need
+_USER_COLS = "user_id, name, email, password, role, created_at"
+_FACILITY_COLS_LIGHT = "facility_id, name, capacity, status, image"
+_FACILITY_COLS_FULL = _FACILITY_COLS_LIGHT + ", description, created_at"
+
+# Booking list columns in Booking.__init__ argument order, so list queries
+# can fetch plain tuples and build each Booking positionally.
+# Times arrive pre-formatted as HH:MM ('%%' because queries are interpolated)
+BOOKING_COLUMNS = """
+    b.booking_id, b.user_id, b.facility_id, b.booking_date,
+    TIME_FORMAT(b.start_time, '%%H:%%i') AS start_time,
+    TIME_FORMAT(b.end_time, '%%H:%%i') AS end_time,
+    b.status, b.purpose, b.created_at
+"""
+BOOKING_SELECT = f"""
+    SELECT {BOOKING_COLUMNS}, NULL AS user_name, f.name AS facility_name,
+           f.capacity AS facility_capacity, f.status AS facility_status
+    FROM bookings b
+    JOIN facilities f ON f.facility_id = b.facility_id
+"""
+BOOKING_SELECT_WITH_USER = f"""
+    SELECT {BOOKING_COLUMNS}, u.name AS user_name, f.name AS facility_name,
+           f.capacity AS facility_capacity, f.status AS facility_status
+    FROM bookings b
+    JOIN users u ON u.user_id = b.user_id
+    JOIN facilities f ON f.facility_id = b.facility_id
+"""
+# Dict rows for list pages that only render fields: dates and times arrive
+# display-ready, so no Booking objects are built per row
+BOOKING_RAW_COLUMNS = """
+    b.booking_id, b.status, b.purpose,
+    DATE_FORMAT(b.booking_date, '%%d %%b %%Y') AS booking_date,
+    TIME_FORMAT(b.start_time, '%%H:%%i') AS start_time,
+    TIME_FORMAT(b.end_time, '%%H:%%i') AS end_time,
+    f.name AS facility_name
+"""
+BOOKING_RAW_SELECT = f"""
+    SELECT {BOOKING_RAW_COLUMNS}
+    FROM bookings b
+    JOIN facilities f ON f.facility_id = b.facility_id
+"""
+BOOKING_RAW_SELECT_WITH_USER = f"""
+    SELECT {BOOKING_RAW_COLUMNS}, u.name AS user_name
+    FROM bookings b
+    JOIN users u ON u.user_id = b.user_id
+    JOIN facilities f ON f.facility_id = b.facility_id
+"""
+
+# Hot query strings, built once at import instead of on every call
+SQL_USER_BY_ID = f"SELECT {_USER_COLS} FROM users WHERE user_id = %s"
+SQL_USER_BY_EMAIL = f"SELECT {_USER_COLS} FROM users WHERE email = %s"
+SQL_FACILITY_BY_ID = (
+    f"SELECT {_FACILITY_COLS_FULL} FROM facilities WHERE facility_id = %s"
+)
+SQL_UPDATE_BOOKING_STATUS = "UPDATE bookings SET status = %s WHERE booking_id = %s"
+SQL_BOOKINGS_BY_USER = BOOKING_SELECT + """
+    WHERE b.user_id = %s
+    ORDER BY b.booking_date DESC, b.start_time DESC, b.booking_id DESC
+"""
+SQL_BOOKINGS_BY_USER_RAW = BOOKING_RAW_SELECT + """
+    WHERE b.user_id = %s
+    ORDER BY b.booking_date DESC, b.start_time DESC, b.booking_id DESC
+"""
+SQL_RECENT_BOOKINGS = BOOKING_SELECT_WITH_USER + """
+    ORDER BY b.created_at DESC, b.booking_id DESC
+    LIMIT %s
+"""
+# Keyset page: rows strictly after the (created_at, booking_id) cursor
+SQL_RECENT_BOOKINGS_BEFORE = BOOKING_SELECT_WITH_USER + """
+    WHERE b.created_at <= %s
+      AND (b.created_at < %s OR b.booking_id < %s)
+    ORDER BY b.created_at DESC, b.booking_id DESC
+    LIMIT %s
+"""
+SQL_UPCOMING_BOOKINGS_BY_USER = BOOKING_SELECT + """
+    WHERE b.user_id = %s
+      AND b.booking_date >= CURDATE()
+      AND b.status IN ('pending', 'approved')
+    ORDER BY b.booking_date ASC, b.start_time ASC, b.booking_id ASC
+    LIMIT %s
+"""
+
+
+def verify_and_update(password, password_hash):
+    """
+    Check a password against a stored hash (argon2 or legacy Werkzeug)
+
+    Returns:
+        tuple: (verified, new_hash) where new_hash is set when the stored
+        hash is legacy or uses outdated argon2 parameters
+    """
+    if not password_hash.startswith("$argon2"):
+        if not check_password_hash(password_hash, password):
+            return False, None
+        return True, password_hasher.hash(password)
+
+    try:
+        password_hasher.verify(password_hash, password)
+    except (VerificationError, InvalidHashError):
+        return False, None
+
+    if password_hasher.check_needs_rehash(password_hash):
+        return True, password_hasher.hash(password)
+    return True, None
+
 
 # =============================================================================
 # DB HELPER
 # =============================================================================
 
-def execute_query(query, params=None, fetch=False, fetch_one=False):
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-
-    cursor.execute(query, params or ())
-
-    if fetch:
-        result = cursor.fetchall()
-    elif fetch_one:
-        result = cursor.fetchone()
-    else:
-        conn.commit()
-        result = cursor.rowcount   
+def execute_query(query, params=None, fetch=False, fetch_one=False, dict_rows=True):
+    with db_cursor(dictionary=dict_rows) as cursor:
+        cursor.execute(query, params or ())
 
-    cursor.close()
-    conn.close()
-    return result
+        if fetch:
+            return cursor.fetchall()
+        if fetch_one:
+            return cursor.fetchone()
+        # Connections run in autocommit mode, no explicit COMMIT needed
+        return cursor.rowcount
 
 
 
@@ -41,6 +155,8 @@ def execute_query(query, params=None, fetch=False, fetch_one=False):
 # =============================================================================
 
 class User(UserMixin):
+    __slots__ = ("id", "user_id", "name", "email", "password", "role", "created_at")
+
     def __init__(self, user_id, name, email, password, role, created_at=None):
         self.id = user_id
         self.user_id = user_id
@@ -50,35 +166,68 @@ class User(UserMixin):
         self.role = role
         self.created_at = created_at
 
+    @classmethod
+    def from_row(cls, row):
+        obj = cls.__new__(cls)
+        obj.id = obj.user_id = row["user_id"]
+        obj.name = row["name"]
+        obj.email = row["email"]
+        obj.password = row["password"]
+        obj.role = row["role"]
+        obj.created_at = row.get("created_at")
+        return obj
+
     @staticmethod
     def create(name, email, password, role):
-        password_hash = generate_password_hash(password)
+        password_hash = password_hasher.hash(password)
         query = """
             INSERT INTO users (name, email, password, role)
             VALUES (%s, %s, %s, %s)
         """
-        return execute_query(query, (name, email, password_hash, role))
+        result = execute_query(query, (name, email, password_hash, role))
+        clear_request_cache()
+        return result
 
     @staticmethod
+    @request_cached
     def get_by_id(user_id):
-        row = execute_query(
-            "SELECT * FROM users WHERE user_id = %s",
-            (user_id,),
-            fetch_one=True
+        row = cache_get_or_set(
+            f"user:{user_id}",
+            USER_CACHE_TTL,
+            lambda: execute_query(
+                SQL_USER_BY_ID,
+                (user_id,),
+                fetch_one=True
+            )
         )
-        return User(**row) if row else None
+        return User.from_row(row) if row else None
 
     @staticmethod
+    @request_cached
     def get_by_email(email):
         row = execute_query(
-            "SELECT * FROM users WHERE email = %s",
+            SQL_USER_BY_EMAIL,
             (email,),
             fetch_one=True
         )
-        return User(**row) if row else None
+        return User.from_row(row) if row else None
+
+    @staticmethod
+    def update_password_hash(user_id, password_hash):
+        result = execute_query(
+            "UPDATE users SET password = %s WHERE user_id = %s",
+            (password_hash, user_id)
+        )
+        cache_delete(f"user:{user_id}")
+        clear_request_cache()
+        return result
 
     def verify_password(self, password):
-        return check_password_hash(self.password, password)
+        verified, new_hash = verify_and_update(password, self.password)
+        if new_hash:
+            self.password = new_hash
+            User.update_password_hash(self.user_id, new_hash)
+        return verified
 
     def is_admin(self):
         return self.role == "admin"
@@ -92,6 +241,11 @@ class User(UserMixin):
 # =============================================================================
 
 class Facility:
+    __slots__ = (
+        "facility_id", "name", "capacity", "status",
+        "description", "image", "created_at"
+    )
+
     def __init__(
         self,
         facility_id,
@@ -110,6 +264,18 @@ class Facility:
         self.image = image
         self.created_at = created_at
 
+    @classmethod
+    def from_row(cls, row):
+        obj = cls.__new__(cls)
+        obj.facility_id = row["facility_id"]
+        obj.name = row["name"]
+        obj.capacity = row["capacity"]
+        obj.status = row["status"]
+        obj.description = row.get("description")
+        obj.image = row.get("image")
+        obj.created_at = row.get("created_at")
+        return obj
+
     # ==========================
     # CREATE
     # ==========================
@@ -119,7 +285,20 @@ class Facility:
             INSERT INTO facilities (name, capacity, description, status, image)
             VALUES (%s, %s, %s, %s, %s)
         """
-        return execute_query(query, (name, capacity, description, status, image))
+        result = execute_query(query, (name, capacity, description, status, image))
+        cache_delete(*FACILITY_CACHE_KEYS, ADMIN_STATS_CACHE_KEY)
+        return result
+
+    @staticmethod
+    def bulk_create(rows, commit_size=500):
+        """rows: iterable of (name, capacity, description, status, image)"""
+        query = """
+            INSERT INTO facilities (name, capacity, description, status, image)
+            VALUES (%s, %s, %s, %s, %s)
+        """
+        result = execute_bulk(query, rows, commit_size)
+        cache_delete(*FACILITY_CACHE_KEYS, ADMIN_STATS_CACHE_KEY)
+        return result
 
     # ==========================
     # READ
@@ -127,40 +306,39 @@ class Facility:
     @staticmethod
     def get_by_id(facility_id):
         row = execute_query(
-            "SELECT * FROM facilities WHERE facility_id = %s",
+            SQL_FACILITY_BY_ID,
             (facility_id,),
             fetch_one=True
         )
-        return Facility(**row) if row else None
+        return Facility.from_row(row) if row else None
 
     @staticmethod
     def get_all(include_inactive=False):
         if include_inactive:
-            query = "SELECT * FROM facilities ORDER BY name"
+            cache_key = "facilities:all:any"
+            query = f"SELECT {_FACILITY_COLS_LIGHT} FROM facilities ORDER BY name"
         else:
-            query = """
-                SELECT * FROM facilities
+            cache_key = "facilities:all:active"
+            query = f"""
+                SELECT {_FACILITY_COLS_LIGHT} FROM facilities
                 WHERE status = 'active'
                 ORDER BY name
             """
-        rows = execute_query(query, fetch=True)
-        return [Facility(**row) for row in rows] if rows else []
-
-    @staticmethod
-    def get_active_count():
-        row = execute_query(
-            "SELECT COUNT(*) AS count FROM facilities WHERE status = 'active'",
-            fetch_one=True
+        rows = cache_get_or_set(
+            cache_key,
+            FACILITY_CACHE_TTL,
+            lambda: execute_query(query, fetch=True)
         )
-        return row["count"] if row else 0
+        return [Facility.from_row(row) for row in rows] if rows else []
 
     # ==========================
     # UPDATE
     # ==========================
     @staticmethod
     def update(facility_id, name, capacity, description, status, image):
-        print(
-            "🟢 SQL UPDATE PARAMS:",
+        logger.debug(
+            "UPDATE facility id=%s name=%s capacity=%s description=%s "
+            "status=%s image=%s",
             facility_id, name, capacity, description, status, image
         )
 
@@ -174,20 +352,24 @@ class Facility:
             WHERE facility_id = %s
         """
 
-        return execute_query(
+        result = execute_query(
             query,
             (name, capacity, description, status, image, facility_id)
         )
+        cache_delete(*FACILITY_CACHE_KEYS, ADMIN_STATS_CACHE_KEY)
+        return result
 
     # ==========================
     # DELETE
     # ==========================
     @staticmethod
     def delete(facility_id):
-        return execute_query(
+        result = execute_query(
             "DELETE FROM facilities WHERE facility_id = %s",
             (facility_id,)
         )
+        cache_delete(*FACILITY_CACHE_KEYS, ADMIN_STATS_CACHE_KEY)
+        return result
 
     # ==========================
     # SAFETY CHECK
@@ -196,15 +378,18 @@ class Facility:
     def has_active_bookings(facility_id):
         row = execute_query(
             """
-            SELECT COUNT(*) AS count
-            FROM bookings
-            WHERE facility_id = %s
-              AND status IN ('pending', 'approved')
+            SELECT EXISTS(
+                SELECT 1
+                FROM bookings
+                WHERE facility_id = %s
+                  AND status IN ('pending', 'approved')
+            )
             """,
             (facility_id,),
-            fetch_one=True
+            fetch_one=True,
+            dict_rows=False
         )
-        return row["count"] > 0 if row else False
+        return bool(row[0]) if row else False
 
 
 
@@ -213,6 +398,12 @@ class Facility:
 # =============================================================================
 
 class Booking:
+    __slots__ = (
+        "booking_id", "user_id", "facility_id", "booking_date",
+        "start_time", "end_time", "status", "purpose", "created_at",
+        "user_name", "facility_name", "facility_capacity", "facility_status"
+    )
+
     def __init__(
         self,
         booking_id,
@@ -225,26 +416,45 @@ class Booking:
         purpose=None,
         created_at=None,
         user_name=None,
-        facility_name=None
+        facility_name=None,
+        facility_capacity=None,
+        facility_status=None
     ):
         self.booking_id = booking_id
         self.user_id = user_id
         self.facility_id = facility_id
         self.booking_date = booking_date
-        self.start_time = self._format_time(start_time)
-        self.end_time = self._format_time(end_time)
+        self.start_time = start_time
+        self.end_time = end_time
         self.status = status
         self.purpose = purpose
         self.created_at = created_at
         self.user_name = user_name
         self.facility_name = facility_name
-
-    def _format_time(self, value):
-        if hasattr(value, "seconds"):
-            h = value.seconds // 3600
-            m = (value.seconds % 3600) // 60
-            return f"{h:02d}:{m:02d}"
-        return value.strftime("%H:%M")
+        self.facility_capacity = facility_capacity
+        self.facility_status = facility_status
+
+    @classmethod
+    def from_row(cls, row):
+        """Build a Booking from a list-query tuple (BOOKING_COLUMNS order)"""
+        obj = cls.__new__(cls)
+        (
+            obj.booking_id, obj.user_id, obj.facility_id, obj.booking_date,
+            obj.start_time, obj.end_time, obj.status, obj.purpose,
+            obj.created_at, obj.user_name, obj.facility_name,
+            obj.facility_capacity, obj.facility_status
+        ) = row
+        return obj
+
+    @property
+    def facility(self):
+        """Facility fields JOINed into list queries; no extra lookup needed"""
+        return SimpleNamespace(
+            facility_id=self.facility_id,
+            name=self.facility_name,
+            capacity=self.facility_capacity,
+            status=self.facility_status
+        )
 
     # ==========================
     # CREATE
@@ -256,65 +466,156 @@ class Booking:
             (user_id, facility_id, booking_date, start_time, end_time, purpose, status)
             VALUES (%s, %s, %s, %s, %s, %s, 'pending')
         """
-        return execute_query(
+        result = execute_query(
             query,
             (user_id, facility_id, booking_date, start_time, end_time, purpose)
         )
+        cache_delete(ADMIN_STATS_CACHE_KEY, f"user_stats:{user_id}")
+        return result
+
+    @staticmethod
+    def bulk_create(rows, commit_size=500):
+        """
+        rows: iterable of
+        (user_id, facility_id, booking_date, start_time, end_time, purpose)
+        """
+        rows = list(rows)
+        # status is left to the column default ('pending'): the driver only
+        # batches VALUES groups made purely of placeholders
+        query = """
+            INSERT INTO bookings
+            (user_id, facility_id, booking_date, start_time, end_time, purpose)
+            VALUES (%s, %s, %s, %s, %s, %s)
+        """
+        result = execute_bulk(query, rows, commit_size)
+        cache_delete(
+            ADMIN_STATS_CACHE_KEY,
+            *{f"user_stats:{row[0]}" for row in rows}
+        )
+        return result
 
     # ==========================
     # READ
     # ==========================
     @staticmethod
-    def get_by_user(user_id):
-        query = """
-            SELECT b.*, f.name AS facility_name
-            FROM bookings b
-            JOIN facilities f ON f.facility_id = b.facility_id
-            WHERE b.user_id = %s
-            ORDER BY b.created_at DESC
-        """
-        rows = execute_query(query, (user_id,), fetch=True)
-        return [Booking(**row) for row in rows] if rows else []
+    def get_by_user(user_id, limit=None, offset=0):
+        query = SQL_BOOKINGS_BY_USER
+        params = [user_id]
+
+        if limit is not None:
+            query += " LIMIT %s OFFSET %s"
+            params += [limit, offset]
+
+        rows = execute_query(query, tuple(params), fetch=True, dict_rows=False)
+        return [Booking.from_row(row) for row in rows] if rows else []
 
     @staticmethod
-    def get_all(status=None):
-        query = """
-            SELECT b.*, u.name AS user_name, f.name AS facility_name
-            FROM bookings b
-            JOIN users u ON u.user_id = b.user_id
-            JOIN facilities f ON f.facility_id = b.facility_id
-        """
+    def get_all(status=None, limit=None, offset=0):
+        query = BOOKING_SELECT_WITH_USER
         params = []
 
         if status:
             query += " WHERE b.status = %s"
             params.append(status)
 
-        query += " ORDER BY b.created_at DESC"
-        rows = execute_query(query, tuple(params) if params else None, fetch=True)
-        return [Booking(**row) for row in rows] if rows else []
+        query += " ORDER BY b.created_at DESC, b.booking_id DESC"
 
+        if limit is not None:
+            query += " LIMIT %s OFFSET %s"
+            params += [limit, offset]
+
+        rows = execute_query(
+            query, tuple(params) if params else None, fetch=True, dict_rows=False
+        )
+        return [Booking.from_row(row) for row in rows] if rows else []
 
     @staticmethod
-    def get_recent(limit=10):
-        query = """
-            SELECT b.*, u.name AS user_name, f.name AS facility_name
-            FROM bookings b
-            JOIN users u ON u.user_id = b.user_id
-            JOIN facilities f ON f.facility_id = b.facility_id
-            ORDER BY b.created_at DESC
-            LIMIT %s
+    def get_by_user_raw(user_id, limit=None, offset=0):
+        """Like get_by_user, as display-ready dicts (see BOOKING_RAW_COLUMNS)"""
+        query = SQL_BOOKINGS_BY_USER_RAW
+        params = [user_id]
+
+        if limit is not None:
+            query += " LIMIT %s OFFSET %s"
+            params += [limit, offset]
+
+        return execute_query(query, tuple(params), fetch=True) or []
+
+    @staticmethod
+    def get_all_raw(status=None, limit=None, offset=0):
+        """Like get_all, as display-ready dicts (see BOOKING_RAW_COLUMNS)"""
+        query = BOOKING_RAW_SELECT_WITH_USER
+        params = []
+
+        if status:
+            query += " WHERE b.status = %s"
+            params.append(status)
+
+        query += " ORDER BY b.created_at DESC, b.booking_id DESC"
+
+        if limit is not None:
+            query += " LIMIT %s OFFSET %s"
+            params += [limit, offset]
+
+        return execute_query(
+            query, tuple(params) if params else None, fetch=True
+        ) or []
+
+    @staticmethod
+    def iter_all(status=None, chunk=1000):
+        """
+        Stream every booking (optionally filtered by status) without loading
+        the whole table; for exports and reports rather than UI pages
+        Inside a request, run no other queries until iteration finishes
+        (see stream_query)
+        """
+        query = BOOKING_SELECT_WITH_USER
+        params = ()
+
+        if status:
+            query += " WHERE b.status = %s"
+            params = (status,)
+
+        query += " ORDER BY b.created_at DESC, b.booking_id DESC"
+
+        for row in stream_query(query, params, chunk_size=chunk):
+            yield Booking.from_row(row)
+
+    @staticmethod
+    def get_recent(limit=10, before=None):
+        """
+        Newest bookings first. For the next page pass
+        before=(created_at, booking_id) of the last booking already shown
         """
-        rows = execute_query(query, (limit,), fetch=True)
-        return [Booking(**row) for row in rows] if rows else []
+        if before:
+            created_at, booking_id = before
+            query = SQL_RECENT_BOOKINGS_BEFORE
+            params = (created_at, created_at, booking_id, limit)
+        else:
+            query = SQL_RECENT_BOOKINGS
+            params = (limit,)
+
+        rows = execute_query(query, params, fetch=True, dict_rows=False)
+        return [Booking.from_row(row) for row in rows] if rows else []
 
     # ==========================
     # UPDATE
     # ==========================
     @staticmethod
     def update_status(booking_id, status):
-        query = "UPDATE bookings SET status = %s WHERE booking_id = %s"
-        return execute_query(query, (status, booking_id))
+        result = execute_query(SQL_UPDATE_BOOKING_STATUS, (status, booking_id))
+
+        owner = execute_query(
+            "SELECT user_id FROM bookings WHERE booking_id = %s",
+            (booking_id,),
+            fetch_one=True,
+            dict_rows=False
+        )
+        if owner:
+            cache_delete(ADMIN_STATS_CACHE_KEY, f"user_stats:{owner[0]}")
+        else:
+            cache_delete(ADMIN_STATS_CACHE_KEY)
+        return result
 
     @staticmethod
     def cancel(booking_id, user_id):
@@ -325,42 +626,54 @@ class Booking:
               AND user_id = %s
               AND status = 'pending'
         """
-        return execute_query(query, (booking_id, user_id))
+        result = execute_query(query, (booking_id, user_id))
+        cache_delete(ADMIN_STATS_CACHE_KEY, f"user_stats:{user_id}")
+        return result
 
     # ==========================
     # ADMIN STATS
     # ==========================
     @staticmethod
     def get_total_count():
-        row = execute_query(
-            "SELECT COUNT(*) AS count FROM bookings",
-            fetch_one=True
-        )
-        return row["count"] if row else 0
+        return Booking.get_dashboard_counts()["total"]
 
     @staticmethod
     def get_pending_count():
-        row = execute_query(
-            "SELECT COUNT(*) AS count FROM bookings WHERE status = 'pending'",
-            fetch_one=True
-        )
-        return row["count"] if row else 0
+        return Booking.get_dashboard_counts()["pending"]
 
     @staticmethod
     def get_approved_count():
-        row = execute_query(
-            "SELECT COUNT(*) AS count FROM bookings WHERE status = 'approved'",
-            fetch_one=True
-        )
-        return row["count"] if row else 0
+        return Booking.get_dashboard_counts()["approved"]
 
     @staticmethod
     def get_rejected_count():
-        row = execute_query(
-            "SELECT COUNT(*) AS count FROM bookings WHERE status = 'rejected'",
-            fetch_one=True
+        return Booking.get_dashboard_counts()["rejected"]
+
+    @staticmethod
+    def get_dashboard_counts():
+        query = """
+            SELECT
+                COUNT(*) AS total,
+                SUM(status='pending') AS pending,
+                SUM(status='approved') AS approved,
+                SUM(status='rejected') AS rejected,
+                (
+                    SELECT COUNT(*) FROM facilities WHERE status = 'active'
+                ) AS facilities
+            FROM bookings
+        """
+        row = cache_get_or_set(
+            ADMIN_STATS_CACHE_KEY,
+            ADMIN_STATS_CACHE_TTL,
+            lambda: execute_query(query, fetch_one=True)
         )
-        return row["count"] if row else 0
+        return {
+            "total": int(row["total"] or 0),
+            "pending": int(row["pending"] or 0),
+            "approved": int(row["approved"] or 0),
+            "rejected": int(row["rejected"] or 0),
+            "facilities": int(row["facilities"] or 0),
+        }
 
     @staticmethod
     def get_user_stats(user_id):
@@ -372,24 +685,23 @@ class Booking:
             FROM bookings
             WHERE user_id = %s
         """
-        row = execute_query(query, (user_id,), fetch_one=True)
+        row = cache_get_or_set(
+            f"user_stats:{user_id}",
+            USER_STATS_CACHE_TTL,
+            lambda: execute_query(query, (user_id,), fetch_one=True)
+        )
         return {
-            "total": row["total"] or 0,
-            "pending": row["pending"] or 0,
-            "approved": row["approved"] or 0,
+            "total": int(row["total"] or 0),
+            "pending": int(row["pending"] or 0),
+            "approved": int(row["approved"] or 0),
         }
 
     @staticmethod
     def get_upcoming_by_user(user_id, limit=5):
-        query = """
-            SELECT b.*, f.name AS facility_name
-            FROM bookings b
-            JOIN facilities f ON f.facility_id = b.facility_id
-            WHERE b.user_id = %s
-              AND b.booking_date >= CURDATE()
-              AND b.status IN ('pending', 'approved')
-            ORDER BY b.booking_date ASC, b.start_time ASC
-            LIMIT %s
-        """
-        rows = execute_query(query, (user_id, limit), fetch=True)
-        return [Booking(**row) for row in rows] if rows else []
+        rows = execute_query(
+            SQL_UPCOMING_BOOKINGS_BY_USER,
+            (user_id, limit),
+            fetch=True,
+            dict_rows=False
+        )
+        return [Booking.from_row(row) for row in rows] if rows else []
@@ -0,0 +1,55 @@
+"""
+Shared helpers for the booking system
+"""
+
+from flask import g, has_app_context
+from functools import wraps
+import hmac
+
+
+def constant_eq(a, b):
+    """
+    Compare two secrets (tokens, hashes, API keys) in constant time
+    Use this instead of == so the comparison time does not leak how many
+    leading characters matched
+    
+    Args:
+        a (str | bytes): First value
+        b (str | bytes): Second value
+    
+    Returns:
+        bool: True if both values are equal
+    """
+    if isinstance(a, str):
+        a = a.encode()
+    if isinstance(b, str):
+        b = b.encode()
+    return hmac.compare_digest(a, b)
+
+
+def request_cached(func):
+    """
+    Memoize a lookup for the rest of the current request (stored on flask.g)
+    Outside an app context every call goes straight through
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not has_app_context():
+            return func(*args, **kwargs)
+        
+        cache = g.setdefault('_request_cache', {})
+        key = (func.__qualname__, args, tuple(sorted(kwargs.items())))
+        if key not in cache:
+            cache[key] = func(*args, **kwargs)
+        return cache[key]
+    
+    return wrapper
+
+
+def clear_request_cache():
+    """
+    Drop all lookups memoized by @request_cached in the current request
+    Call after writes that change memoized rows
+    """
+    if has_app_context():
+        g.pop('_request_cache', None)